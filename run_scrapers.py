@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Run all venue scrapers concurrently
+Each scraper runs as its own process (up to MAX_CONCURRENT at once), so the total time
+is close to the slowest few scrapers instead of the sum of all of them
+Output is buffered per scraper and printed as each one finishes
+"""
+
+import asyncio
+import sys
+import time
+
+# Most scrapers drive their own Chromium, so cap how many run at once to bound memory
+MAX_CONCURRENT = 5
+
+# (script, name used in failure messages)
+SCRAPERS = [
+    ("scrapers/velvet_elk.py", "Velvet Elk"),
+    ("scrapers/junkyard_social_club.py", "Junkyard"),
+    ("scrapers/mountain_sun_pub.py", "Mountain Sun"),
+    ("scrapers/st_julien_entertainment.py", "St Julien"),
+    ("scrapers/trident_cafe.py", "Trident"),
+    ("scrapers/license_no1.py", "License No 1"),
+    ("scrapers/jungle.py", "Jungle"),
+    ("scrapers/rosetta_hall.py", "Rosetta Hall"),
+    ("scrapers/gold_hill_inn.py", "Gold Hill Inn"),
+    ("scrapers/300_suns_brewing.py", "300 Suns Brewing"),
+    ("scrapers/roots_music_project.py", "Roots Music Project"),
+    ("scrapers/bricks_on_main.py", "Bricks on Main"),
+    ("scrapers/scrape_summer_series.py", "Summer Series"),
+    ("scrapers/scrape_z2_entertainment.py", "Z2 Entertainment"),
+    ("scrapers/scrape_etown.py", "eTown Hall"),
+]
+
+async def run_scraper(script, name, limit):
+    """Run one scraper script once a slot is free, then print its output in one block"""
+
+    async with limit:
+        start = time.monotonic()
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, script,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        output, _ = await process.communicate()
+        elapsed = time.monotonic() - start
+
+    print(f"\n{'='*60}")
+    print(f"{name} ({script}) - {elapsed:.1f}s")
+    print(f"{'='*60}")
+    print(output.decode('utf-8', errors='replace'), end='', flush=True)
+
+    if process.returncode != 0:
+        print(f"{name} scraper failed")
+
+    return process.returncode == 0
+
+async def run_all():
+    """Run the scrapers, up to MAX_CONCURRENT at a time, and wait for all of them"""
+
+    limit = asyncio.Semaphore(MAX_CONCURRENT)
+    results = await asyncio.gather(*(run_scraper(script, name, limit) for script, name in SCRAPERS))
+
+    failed = [name for (_, name), ok in zip(SCRAPERS, results) if not ok]
+    print(f"\n✓ {len(SCRAPERS) - len(failed)}/{len(SCRAPERS)} scrapers succeeded")
+    if failed:
+        print(f"✗ Failed: {', '.join(failed)}")
+
+def main():
+    print("Running scrapers...")
+    asyncio.run(run_all())
+
+if __name__ == "__main__":
+    main()
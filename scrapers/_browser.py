@@ -0,0 +1,103 @@
+"""
+Per-profile persistent Playwright contexts for the scrapers
+Each scraper gets its own Chromium persistent context backed by its own profile directory, so
+the HTTP cache and compiled JS survive between runs; nothing is shared between scrapers
+A context is launched on first use and closed when the process exits
+"""
+
+import atexit
+import threading
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+
+# Request types the scrapers never need; only the page markup gets parsed
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'stylesheet', 'media', 'websocket'})
+
+# One profile per scraper, since Chromium locks a profile to a single running browser
+PROFILE_ROOT = Path("/tmp/playwright-profiles")
+
+_lock = threading.Lock()
+_playwright = None
+_contexts = {}
+
+
+def get_profile_context(profile):
+    """Return the persistent headless Chromium context for profile, launching it if needed"""
+
+    global _playwright
+
+    with _lock:
+        if profile not in _contexts:
+            if _playwright is None:
+                _playwright = sync_playwright().start()
+                atexit.register(close_profile_contexts)
+
+            print("Launching browser...")
+            _contexts[profile] = _playwright.chromium.launch_persistent_context(
+                str(PROFILE_ROOT / profile),
+                headless=True,
+                args=['--no-sandbox', '--disable-setuid-sandbox']
+            )
+
+        return _contexts[profile]
+
+
+def open_profile_page(profile):
+    """
+    Return a page in profile's context
+    A persistent context starts with a blank page already open, so that one is used
+    instead of opening a second tab
+    """
+
+    context = get_profile_context(profile)
+    if context.pages:
+        return context.pages[0]
+    return context.new_page()
+
+
+def close_profile_contexts():
+    """Close every profile context and stop Playwright (safe to call more than once)"""
+
+    global _playwright
+
+    with _lock:
+        for context in _contexts.values():
+            context.close()
+        _contexts.clear()
+
+        if _playwright is not None:
+            _playwright.stop()
+            _playwright = None
+
+
+def block_resources(page):
+    """Abort image, font, stylesheet, media and websocket requests made by the page"""
+
+    page.route('**/*', lambda route: route.abort()
+               if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+               else route.continue_())
+
+
+def scroll_until_stable(page, selector, max_scrolls=5, pause_ms=1000):
+    """
+    Scroll to the bottom of the page to trigger lazy loading
+    Stops early once the number of elements matching selector hasn't grown for two scrolls
+    """
+
+    count = page.locator(selector).count()
+    unchanged = 0
+
+    for _ in range(max_scrolls):
+        page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+        page.wait_for_timeout(pause_ms)
+
+        new_count = page.locator(selector).count()
+        if new_count > count:
+            count = new_count
+            unchanged = 0
+        else:
+            unchanged += 1
+            if unchanged >= 2:
+                break
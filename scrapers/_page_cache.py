@@ -0,0 +1,37 @@
+"""
+On-disk cache for fetched event pages
+Reruns within the TTL parse the saved HTML instead of hitting the venue site again,
+which keeps iterating on the parse code fast and spares the source sites
+Set PAGE_CACHE_TTL=0 to always fetch
+"""
+
+import gzip
+import hashlib
+import os
+import time
+from pathlib import Path
+
+
+CACHE_DIR = Path(".cache")
+PAGE_CACHE_TTL = int(os.environ.get("PAGE_CACHE_TTL", "600"))  # seconds
+
+
+def cached_page(url, fetch, ttl=PAGE_CACHE_TTL):
+    """
+    Return the HTML for url from the cache if it is younger than ttl seconds
+    Otherwise call fetch() for fresh HTML and cache it (empty results aren't cached)
+    """
+
+    cache_file = CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html.gz"
+
+    if ttl > 0 and cache_file.exists() and time.time() - cache_file.stat().st_mtime < ttl:
+        print(f"Using cached page for {url}")
+        return gzip.decompress(cache_file.read_bytes()).decode('utf-8')
+
+    html = fetch()
+
+    if ttl > 0 and html:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(gzip.compress(html.encode('utf-8')))
+
+    return html
@@ -12,15 +12,21 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from bs4 import BeautifulSoup
-import json
+import soupsieve as sv
+import orjson
 from datetime import datetime
-import re
+from functools import lru_cache
+import string
 from pathlib import Path
 import hashlib
-import requests
+import base64
 import time
+import os
+import signal
+import socket
+import subprocess
 
 # Venue mappings
 VENUE_INFO = {
@@ -46,10 +52,209 @@ VENUE_INFO = {
     }
 }
 
+# Venues whose events are shown (checked before any card parsing)
+INCLUDED_VENUES = frozenset(venue for venue, info in VENUE_INFO.items() if info['include'])
+
+# Event card field selectors, compiled once and reused for every card
+LOCATION_SELECTOR = sv.compile('div.location')
+TITLE_LINK_SELECTOR = sv.compile('h3.title a')
+SINGLE_DATE_SELECTOR = sv.compile('span.m-date__singleDate')
+RANGE_FIRST_SELECTOR = sv.compile('span.m-date__rangeFirst')
+RANGE_LAST_SELECTOR = sv.compile('span.m-date__rangeLast')
+MONTH_SELECTOR = sv.compile('span.m-date__month')
+DAY_SELECTOR = sv.compile('span.m-date__day')
+YEAR_SELECTOR = sv.compile('span.m-date__year')
+IMAGE_SELECTOR = sv.compile('img')
+TICKET_LINK_SELECTOR = sv.compile('div.buttons a.tickets')
+
 # Image download settings
 IMAGE_DOWNLOAD_DIR = Path("images/z2")
 DOWNLOAD_IMAGES = True  # Set to False to use venue default images instead
 
+# Maps every ASCII character except [a-z0-9] to '-' for image filenames
+SLUG_TABLE = str.maketrans({
+    chr(c): '-' for c in range(128) if chr(c) not in string.ascii_lowercase + string.digits
+})
+
+# Image URL -> local path (None if the download failed), so repeated promoter art is only handled once per run
+IMAGE_CACHE = {}
+
+# "Load More" button selectors, combined into one union query
+# The button has id="loadMoreEvents" and class="eventList__showMore"
+LOAD_MORE_SELECTOR = ", ".join([
+    "#loadMoreEvents",  # Primary selector - the actual ID
+    "button.eventList__showMore",  # Class-based backup
+    "button[data-options='events']",  # Data attribute backup
+])
+
+# Fetches a batch of images concurrently from inside the current page
+# Returns a list of data: URLs in the same order (null for any that failed)
+# Runs through execute_async_script, so the last argument is Selenium's completion callback
+FETCH_IMAGES_SCRIPT = """
+const [urls, done] = arguments;
+const fetchAsDataUrl = url => fetch(url)
+    .then(response => response.ok ? response.blob() : Promise.reject(response.status))
+    .then(blob => new Promise(resolve => {
+        const reader = new FileReader();
+        reader.onload = () => resolve(reader.result);
+        reader.onerror = () => resolve(null);
+        reader.readAsDataURL(blob);
+    }))
+    .catch(() => null);
+Promise.all(urls.map(fetchAsDataUrl)).then(done);
+"""
+
+# Persistent chromedriver settings
+# chromedriver is started once and left running so later runs skip its cold start
+CHROMEDRIVER_PORT = 9515
+CHROMEDRIVER_PIDFILE = Path("/tmp/chromedriver.pid")
+
+# Persistent Chrome profile, so the browser's HTTP cache (site assets, images) survives between runs
+CHROME_PROFILE_DIR = Path("/tmp/z2-chrome-profile")
+
+def chromedriver_is_listening():
+    """Check whether something is accepting connections on the chromedriver port"""
+    try:
+        with socket.create_connection(("127.0.0.1", CHROMEDRIVER_PORT), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+def process_cmdline(pid):
+    """Return the command line of a running process as a list of arguments ([] if it can't be read)"""
+    try:
+        raw = Path(f"/proc/{pid}/cmdline").read_bytes()
+    except OSError:
+        return []
+    return [arg.decode('utf-8', errors='replace') for arg in raw.split(b'\0') if arg]
+
+def recorded_chromedriver_pid():
+    """
+    Return the pid from CHROMEDRIVER_PIDFILE if that process is still our chromedriver
+    After a reboot the pid may belong to an unrelated process, so its command line is checked
+    """
+    try:
+        pid = int(CHROMEDRIVER_PIDFILE.read_text().strip())
+    except (OSError, ValueError):
+        return None
+    
+    args = process_cmdline(pid)
+    if args and 'chromedriver' in Path(args[0]).name and f"--port={CHROMEDRIVER_PORT}" in args:
+        return pid
+    return None
+
+def ensure_chromedriver():
+    """
+    Start chromedriver as a long-lived service if it isn't already running
+    Returns the URL to connect webdriver.Remote to, or None if chromedriver isn't installed
+    """
+    driver_url = f"http://127.0.0.1:{CHROMEDRIVER_PORT}"
+    
+    # Reuse the chromedriver left running by a previous run
+    if CHROMEDRIVER_PIDFILE.exists():
+        pid = recorded_chromedriver_pid()
+        if pid and chromedriver_is_listening():
+            print(f"Reusing running chromedriver (pid {pid})")
+            return driver_url
+        CHROMEDRIVER_PIDFILE.unlink(missing_ok=True)
+    
+    print(f"Starting chromedriver on port {CHROMEDRIVER_PORT}...")
+    try:
+        process = subprocess.Popen(
+            ["chromedriver", f"--port={CHROMEDRIVER_PORT}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True  # Keep chromedriver alive after this script exits
+        )
+    except FileNotFoundError:
+        print("chromedriver not found on PATH, falling back to a one-off driver")
+        return None
+    
+    CHROMEDRIVER_PIDFILE.write_text(str(process.pid))
+    
+    # Wait for chromedriver to start accepting connections
+    for _ in range(50):
+        if chromedriver_is_listening():
+            return driver_url
+        time.sleep(0.2)
+    
+    raise RuntimeError(f"chromedriver did not start listening on port {CHROMEDRIVER_PORT}")
+
+def stop_chromedriver():
+    """Kill the chromedriver recorded in the pidfile (only if it really is chromedriver) and forget it"""
+    pid = recorded_chromedriver_pid()
+    if pid:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            print(f"Stopped stale chromedriver (pid {pid})")
+        except (ProcessLookupError, PermissionError):
+            pass
+    CHROMEDRIVER_PIDFILE.unlink(missing_ok=True)
+    
+    # Give it a moment to release the port before a new one is started
+    for _ in range(25):
+        if not chromedriver_is_listening():
+            break
+        time.sleep(0.2)
+
+def clear_profile_lock():
+    """
+    Kill a Chrome on this machine left holding CHROME_PROFILE_DIR and remove its Singleton* lock files
+    A killed run can leave its Chrome alive (chromedriver outlives the script), and every later
+    session then fails with "user data directory is already in use"
+    """
+    lock = CHROME_PROFILE_DIR / "SingletonLock"
+    try:
+        # The lock is a symlink to "<hostname>-<pid>" of the Chrome that owns the profile
+        hostname, _, pid = os.readlink(lock).rpartition('-')
+        pid = int(pid)
+    except (OSError, ValueError):
+        hostname, pid = None, None
+    
+    # Only kill it if it's a Chrome on this machine using this profile; a reused pid or
+    # another machine's lock just gets its files removed below
+    if pid and hostname == socket.gethostname():
+        args = process_cmdline(pid)
+        if (args and any(name in Path(args[0]).name for name in ('chrome', 'chromium'))
+                and f"--user-data-dir={CHROME_PROFILE_DIR}" in args):
+            try:
+                os.kill(pid, signal.SIGTERM)
+                print(f"Stopped stale Chrome holding the profile (pid {pid})")
+                time.sleep(1)
+            except (ProcessLookupError, PermissionError):
+                pass
+    
+    for path in CHROME_PROFILE_DIR.glob("Singleton*"):
+        path.unlink(missing_ok=True)
+
+def start_driver(chrome_options):
+    """
+    Open a browser session on the persistent chromedriver
+    A reused chromedriver can stop matching Chrome after a Chrome update, and a killed run can
+    leave the profile locked, so if the session can't be created the old driver and any stale
+    profile lock are cleared and a fresh chromedriver is tried once, then a one-off driver
+    """
+    driver_url = ensure_chromedriver()
+    if not driver_url:
+        return webdriver.Chrome(options=chrome_options)
+    
+    try:
+        return webdriver.Remote(command_executor=driver_url, options=chrome_options)
+    except WebDriverException as e:
+        print(f"Could not start a session on the running chromedriver, restarting it: {e.msg}")
+        stop_chromedriver()
+        clear_profile_lock()
+    
+    driver_url = ensure_chromedriver()
+    if driver_url:
+        try:
+            return webdriver.Remote(command_executor=driver_url, options=chrome_options)
+        except WebDriverException as e:
+            print(f"Fresh chromedriver failed too, falling back to a one-off driver: {e.msg}")
+            clear_profile_lock()
+    
+    return webdriver.Chrome(options=chrome_options)
+
 def scrape_events():
     """Scrape all events using Selenium (real browser automation)"""
     
@@ -60,17 +265,20 @@ def scrape_events():
     chrome_options.add_argument('--disable-dev-shm-usage')  # Overcome limited resource problems
     chrome_options.add_argument('--disable-gpu')  # Disable GPU hardware acceleration
     chrome_options.add_argument('--window-size=1920,1080')  # Set window size
+    chrome_options.add_argument(f'--user-data-dir={CHROME_PROFILE_DIR}')  # Reuse the HTTP cache from earlier runs
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
     
     all_events = []
-    seen_event_ids = set()  # Track unique events by ID
+    seen_event_ids = set()  # Track unique events by (venue, title, normalized date)
     
-    driver = None
+    # Connect to the persistent chromedriver (started on first run)
+    # This is outside the try below so a browser that can't start fails the run
+    # instead of looking like a run that found no events
+    print("Initializing Chrome browser...")
+    driver = start_driver(chrome_options)
     
     try:
-        # Create Chrome driver
-        print("Initializing Chrome browser...")
-        driver = webdriver.Chrome(options=chrome_options)
+        driver.set_script_timeout(60)  # Batched image fetches can take a while
         
         print("Scraping Z2 Entertainment events using Selenium...")
         print(f"\n{'='*60}")
@@ -91,21 +299,14 @@ def scrape_events():
         
         # Parse initial page events
         print("\nParsing initial page events...")
-        html = driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
-        event_items = soup.find_all('div', class_='eventItem')
-        
-        for item in event_items:
-            event = parse_event_card(item, driver)
-            if event:
-                event_id = f"{event['venue']}|{event['title']}|{event['date']}"
-                if event_id not in seen_event_ids:
-                    seen_event_ids.add(event_id)
-                    all_events.append(event)
-                    print(f"  + {event['venue']}: {event['title']} ({event['date']})")
+        event_items = fetch_event_cards(driver)
+        pending_images = add_new_events(event_items, all_events, seen_event_ids)
         
         print(f"\n✓ Initial page: {len(all_events)} events captured")
         
+        # Track how many event cards have been parsed so each click only parses new ones
+        loaded_count = len(event_items)
+        
         # Click "Load More" button 4 times to get January + February events
         # (Extra clicks account for other venues in the list)
         print("\nClicking 'Load More' button to get additional events...")
@@ -122,22 +323,9 @@ def scrape_events():
                 time.sleep(2)  # Give button time to render
                 
                 # Find and click the Load More button
-                # The button has id="loadMoreEvents" and class="eventList__showMore"
-                load_more_button = None
-                selectors = [
-                    "#loadMoreEvents",  # Primary selector - the actual ID
-                    "button.eventList__showMore",  # Class-based backup
-                    "button[data-options='events']",  # Data attribute backup
-                ]
-                
-                for selector in selectors:
-                    try:
-                        load_more_button = driver.find_element(By.CSS_SELECTOR, selector)
-                        if load_more_button and load_more_button.is_displayed():
-                            print(f"  ✓ Found button using selector: {selector}")
-                            break
-                    except NoSuchElementException:
-                        continue
+                # A single union query matches any of the selectors in one round trip
+                candidates = driver.find_elements(By.CSS_SELECTOR, LOAD_MORE_SELECTOR)
+                load_more_button = next((c for c in candidates if c.is_displayed()), None)
                 
                 if not load_more_button:
                     print("  ✗ Load More button not found - reached end of events")
@@ -147,27 +335,21 @@ def scrape_events():
                 driver.execute_script("arguments[0].click();", load_more_button)
                 print("  ✓ Clicked Load More button")
                 
-                # Wait for new events to load (wait for AJAX response)
-                time.sleep(3)
+                # Download the previous batch's images while the next page loads
+                download_event_images(driver, pending_images)
+                pending_images = []
                 
-                # Parse newly loaded events
-                html = driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                event_items = soup.find_all('div', class_='eventItem')
+                # Wait for new event cards to be appended (AJAX response)
+                WebDriverWait(driver, 10).until(
+                    lambda d: len(d.find_elements(By.CSS_SELECTOR, "div.eventItem")) > loaded_count
+                )
                 
-                events_before = len(all_events)
+                # Parse only the newly appended cards instead of re-parsing the whole page
+                new_items = fetch_event_cards(driver, start=loaded_count)
+                loaded_count += len(new_items)
                 
-                for item in event_items:
-                    event = parse_event_card(item, driver)
-                    if event:
-                        event_id = f"{event['venue']}|{event['title']}|{event['date']}"
-                        if event_id not in seen_event_ids:
-                            seen_event_ids.add(event_id)
-                            all_events.append(event)
-                            print(f"    + {event['venue']}: {event['title']} ({event['date']})")
-                
-                new_events = len(all_events) - events_before
-                print(f"  ✓ Found {new_events} new events (total: {len(all_events)})")
+                pending_images = add_new_events(new_items, all_events, seen_event_ids)
+                print(f"  ✓ Found {len(pending_images)} new events (total: {len(all_events)})")
                 
                 # Continue clicking even if no new Boulder/Fox events (might be other venues)
                     
@@ -178,6 +360,9 @@ def scrape_events():
                 print(f"  ✗ Error clicking Load More: {e}")
                 break
         
+        # Download images for the last batch
+        download_event_images(driver, pending_images)
+        
         print(f"\n{'='*60}")
         print(f"Total unique events scraped: {len(all_events)}")
         print(f"{'='*60}")
@@ -188,104 +373,216 @@ def scrape_events():
         traceback.print_exc()
         
     finally:
-        # Always close the browser
+        # Always close the browser (chromedriver itself stays running for the next run)
         if driver:
             print("\nClosing browser...")
             driver.quit()
     
     return all_events
 
-def download_event_image(driver, image_url, title, venue):
+def fetch_event_cards(driver, start=0):
     """
-    Download event image using Selenium (bypasses 406 blocks)
-    Returns local path if successful, None if failed
+    Get the event cards currently on the page, skipping the first `start` cards
+    Each card's HTML is pulled in one script call and parsed on its own
     """
-    if not DOWNLOAD_IMAGES or not image_url or image_url == VENUE_INFO.get(venue, {}).get('image'):
-        return None
+    cards_html = driver.execute_script(
+        "return Array.from(document.querySelectorAll('div.eventItem'))"
+        ".slice(arguments[0]).map(el => el.outerHTML);",
+        start
+    )
+    return [BeautifulSoup(card_html, 'lxml').div for card_html in cards_html]
+
+def add_new_events(event_items, all_events, seen_event_ids):
+    """
+    Parse event cards and append events not seen yet
+    Returns the newly added events, whose images still need downloading
+    """
+    new_events = []
+    lines = []
     
-    try:
-        # Create images/z2 directory if it doesn't exist
-        IMAGE_DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
-        
-        # Create safe filename from title
-        # Use hash to keep filename length reasonable
-        safe_title = re.sub(r'[^a-z0-9]+', '-', title.lower())[:50]
-        url_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
-        
-        # Determine file extension from URL
-        ext = '.jpg'
-        if '.png' in image_url.lower():
-            ext = '.png'
-        elif '.gif' in image_url.lower():
-            ext = '.gif'
-        elif '.webp' in image_url.lower():
-            ext = '.webp'
-        
-        filename = f"{safe_title}-{url_hash}{ext}"
-        filepath = IMAGE_DOWNLOAD_DIR / filename
+    for item in event_items:
+        venue_name = included_venue(item)
+        if not venue_name:
+            continue
+        
+        event = parse_event_card(item, venue_name)
+        if not event:
+            continue
+        
+        event_id = (event['venue'], event['title'], event['normalized_date'])
+        if event_id in seen_event_ids:
+            continue
+        
+        seen_event_ids.add(event_id)
+        new_events.append(event)
+        lines.append(f"  + {event['venue']}: {event['title']} ({event['date']})")
+    
+    all_events.extend(new_events)
+    
+    # One write per batch instead of a print per event
+    if lines:
+        print("\n".join(lines))
+    
+    return new_events
+
+def image_filepath(image_url, title):
+    """Build the local path for an event image from its title and URL"""
+    
+    # Create safe filename from title
+    # Use hash to keep filename length reasonable
+    # Non-ASCII characters become '?' first so the table covers them too
+    slug = title.lower().encode('ascii', 'replace').decode('ascii').translate(SLUG_TABLE)
+    while '--' in slug:
+        slug = slug.replace('--', '-')
+    safe_title = slug[:50]
+    url_hash = hashlib.blake2b(image_url.encode('utf-8'), digest_size=4).hexdigest()
+    
+    # Determine file extension from URL
+    ext = '.jpg'
+    if '.png' in image_url.lower():
+        ext = '.png'
+    elif '.gif' in image_url.lower():
+        ext = '.gif'
+    elif '.webp' in image_url.lower():
+        ext = '.webp'
+    
+    return IMAGE_DOWNLOAD_DIR / f"{safe_title}-{url_hash}{ext}"
+
+def download_event_images(driver, events):
+    """
+    Download images for a batch of events through the Selenium browser (bypasses 406 blocks)
+    All in-page fetches run concurrently in one script call
+    Each event's image is set to the local path, or left as the venue default if the download fails
+    """
+    pending = {}
+    
+    for event in events:
+        image_url = event.pop('remote_image')
+        if not image_url:
+            continue
         
-        # Skip if already downloaded
-        if filepath.exists():
-            print(f"    Image already exists: {filepath}")
-            return str(filepath)
+        # Already handled earlier in this run (no hashing or disk check needed)
+        if image_url in IMAGE_CACHE:
+            if IMAGE_CACHE[image_url]:
+                event['image'] = IMAGE_CACHE[image_url]
+            continue
         
-        # Download image using Selenium (bypasses 406 blocks)
-        print(f"    Downloading with Selenium: {image_url}")
+        # Same image used by more than one event in this batch
+        if image_url in pending:
+            pending[image_url][1].append(event)
+            continue
         
-        # Navigate to the image URL
-        driver.get(image_url)
-        time.sleep(1)  # Brief wait for image to load
+        filepath = image_filepath(image_url, event['title'])
         
-        # Take a screenshot of the image element
-        # Find the img tag on the page
+        # Skip if already downloaded
+        if filepath.exists():
+            print(f"    Image already exists: {filepath}")
+            IMAGE_CACHE[image_url] = event['image'] = str(filepath)
+        else:
+            pending[image_url] = (filepath, [event])
+    
+    if not pending:
+        return
+    
+    # Create images/z2 directory if it doesn't exist
+    IMAGE_DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    
+    # Fetch the original image bytes from inside the events page
+    # No navigation or PNG re-encode, and the browser stays on the events list
+    print(f"    Downloading {len(pending)} images in browser...")
+    try:
+        data_urls = driver.execute_async_script(FETCH_IMAGES_SCRIPT, list(pending))
+    except Exception as e:
+        print(f"    ✗ In-page image fetch failed: {e}")
+        data_urls = [None] * len(pending)
+    
+    for (image_url, (filepath, url_events)), data_url in zip(pending.items(), data_urls):
+        IMAGE_CACHE[image_url] = None
         try:
-            img_element = driver.find_element(By.TAG_NAME, "img")
+            if data_url:
+                image_bytes = base64.b64decode(data_url.split(',', 1)[1])
+            else:
+                # Cross-origin images without CORS headers can't be fetched in-page
+                print(f"    In-page fetch failed for {image_url}, falling back to a screenshot")
+                image_bytes = screenshot_image(driver, image_url)
             
-            # Get the image as PNG bytes
-            image_bytes = img_element.screenshot_as_png
-            
-            # Save to file
-            with open(filepath, 'wb') as f:
-                f.write(image_bytes)
+            if not image_bytes:
+                continue
             
+            filepath.write_bytes(image_bytes)
+            IMAGE_CACHE[image_url] = str(filepath)
+            for event in url_events:
+                event['image'] = str(filepath)
             print(f"    ✓ Downloaded image: {filepath}")
-            return str(filepath)
             
         except Exception as e:
-            print(f"    ✗ Could not find image element: {e}")
-            return None
+            print(f"    ✗ Failed to download image: {e}")
+
+def screenshot_image(driver, image_url):
+    """
+    Screenshot an image in a separate tab (fallback when the in-page fetch fails)
+    Returns PNG bytes, or None if the image element couldn't be found
+    """
+    events_tab = driver.current_window_handle
+    driver.switch_to.new_window('tab')
+    
+    try:
+        driver.get(image_url)
+        time.sleep(1)  # Brief wait for image to load
+        
+        img_element = driver.find_element(By.TAG_NAME, "img")
+        return img_element.screenshot_as_png
         
     except Exception as e:
-        print(f"    ✗ Failed to download image: {e}")
+        print(f"    ✗ Could not find image element: {e}")
         return None
+        
+    finally:
+        # Close the image tab and return to the events list
+        driver.close()
+        driver.switch_to.window(events_tab)
 
-def parse_event_card(card, driver):
-    """Parse individual event card based on Z2 Entertainment HTML structure"""
-    
-    # Extract venue name from div.location
-    location_elem = card.find('div', class_='location')
-    if not location_elem:
+def included_venue(card):
+    """
+    Return the card's venue name if it's a venue we show, otherwise None
+    Checked before parsing, so excluded venues are skipped early
+    """
+    location_elem = LOCATION_SELECTOR.select_one(card)
+    if location_elem is None:
         return None
     
     venue_name = location_elem.get_text(strip=True)
+    return venue_name if venue_name in INCLUDED_VENUES else None
+
+@lru_cache(maxsize=1024)
+def normalize_date(date_str):
+    """Convert a card date like 'Jan 15, 2026' to YYYY-MM-DD (None if unparseable)
     
-    # Check if this is a venue we care about
-    if venue_name not in VENUE_INFO:
-        return None
+    Many events share a date, so results are cached per date string.
+    """
+    # Pick the month format from the month's length so the usual case parses first time
+    if len(date_str.split(' ', 1)[0]) == 3:
+        formats = ("%b %d, %Y", "%B %d, %Y")
+    else:
+        formats = ("%B %d, %Y", "%b %d, %Y")
     
-    venue_config = VENUE_INFO[venue_name]
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+def parse_event_card(card, venue_name):
+    """
+    Parse individual event card based on Z2 Entertainment HTML structure
+    venue_name comes from included_venue(), which has already checked the card's venue
+    """
     
-    # Skip if we're not including this venue yet
-    if not venue_config['include']:
-        print(f"Skipping {venue_name} event (not included yet)")
-        return None
+    venue_config = VENUE_INFO[venue_name]
     
     # Extract event title from h3.title a
-    title_elem = card.find('h3', class_='title')
-    if not title_elem:
-        return None
-    
-    title_link = title_elem.find('a')
+    title_link = TITLE_LINK_SELECTOR.select_one(card)
     if not title_link:
         return None
     
@@ -295,14 +592,13 @@ def parse_event_card(card, driver):
         event_url = f"https://www.z2ent.com{event_url}"
     
     # Extract date - handle both single dates and date ranges
-    date_container = card.find('span', class_='m-date__singleDate')
+    date_container = SINGLE_DATE_SELECTOR.select_one(card)
     
     if date_container:
         # Single date format: "Wed, Jan 15, 2026"
-        weekday_elem = date_container.find('span', class_='m-date__weekday')
-        month_elem = date_container.find('span', class_='m-date__month')
-        day_elem = date_container.find('span', class_='m-date__day')
-        year_elem = date_container.find('span', class_='m-date__year')
+        month_elem = MONTH_SELECTOR.select_one(date_container)
+        day_elem = DAY_SELECTOR.select_one(date_container)
+        year_elem = YEAR_SELECTOR.select_one(date_container)
         
         if not all([month_elem, day_elem, year_elem]):
             return None
@@ -316,19 +612,18 @@ def parse_event_card(card, driver):
         
     else:
         # Date range format: "Jan 15 - 17, 2026"
-        range_first = card.find('span', class_='m-date__rangeFirst')
-        range_last = card.find('span', class_='m-date__rangeLast')
+        range_first = RANGE_FIRST_SELECTOR.select_one(card)
+        range_last = RANGE_LAST_SELECTOR.select_one(card)
         
         if not range_first or not range_last:
             return None
         
         # Extract start date components
-        month_elem = range_first.find('span', class_='m-date__month')
-        start_day_elem = range_first.find('span', class_='m-date__day')
+        month_elem = MONTH_SELECTOR.select_one(range_first)
+        start_day_elem = DAY_SELECTOR.select_one(range_first)
         
-        # Extract end day and year
-        end_day_elem = range_last.find('span', class_='m-date__day')
-        year_elem = range_last.find('span', class_='m-date__year')
+        # Extract year from the end of the range
+        year_elem = YEAR_SELECTOR.select_one(range_last)
         
         if not all([month_elem, start_day_elem, year_elem]):
             return None
@@ -341,43 +636,28 @@ def parse_event_card(card, driver):
         date_str = f"{month_text} {start_day_text}, {year_text}"
     
     # Parse and normalize the date
-    try:
-        parsed_date = datetime.strptime(date_str, "%B %d, %Y")
-        normalized_date = parsed_date.strftime("%Y-%m-%d")
-    except ValueError:
-        try:
-            # Try abbreviated month format
-            parsed_date = datetime.strptime(date_str, "%b %d, %Y")
-            normalized_date = parsed_date.strftime("%Y-%m-%d")
-        except ValueError:
-            print(f"  Could not parse date: {date_str}")
-            return None
+    normalized_date = normalize_date(date_str)
+    if not normalized_date:
+        print(f"  Could not parse date: {date_str}")
+        return None
     
-    # Extract image URL
-    image_elem = card.find('img')
+    # Extract image URL (downloaded later with the rest of the batch)
+    image_elem = IMAGE_SELECTOR.select_one(card)
     image_url = None
     if image_elem and image_elem.get('src'):
         image_url = image_elem['src']
         if image_url and not image_url.startswith('http'):
             image_url = f"https://www.z2ent.com{image_url}"
     
-    # Download image if available
-    local_image_path = None
-    if image_url:
-        local_image_path = download_event_image(driver, image_url, title, venue_name)
-    
-    # Use local image path if downloaded, otherwise use default venue image
-    final_image = local_image_path if local_image_path else venue_config['image']
+    # Nothing to download if images are off or the card just shows the venue default
+    if not DOWNLOAD_IMAGES or image_url == venue_config['image']:
+        image_url = None
     
     # Extract ticket link from buttons section
     ticket_link = None
-    buttons_div = card.find('div', class_='buttons')
-    if buttons_div:
-        ticket_elem = buttons_div.find('a', class_='tickets')
-        if ticket_elem and ticket_elem.get('href'):
-            ticket_link = ticket_elem['href']
-    
-    print(f"✓ {title} at {venue_name} on {date_str}")
+    ticket_elem = TICKET_LINK_SELECTOR.select_one(card)
+    if ticket_elem and ticket_elem.get('href'):
+        ticket_link = ticket_elem['href']
     
     return {
         "title": title,
@@ -386,11 +666,12 @@ def parse_event_card(card, driver):
         "date": date_str,
         "normalized_date": normalized_date,
         "time": None,  # Z2 doesn't show times on event cards
-        "image": final_image,
+        "image": venue_config['image'],  # Replaced by the downloaded image when available
         "url": event_url,
         "ticket_link": ticket_link,
         "tags": ["music", "concert"],
-        "description": None
+        "description": None,
+        "remote_image": image_url  # Removed once the image is downloaded
     }
 
 def main():
@@ -411,8 +692,7 @@ def main():
     output_file = "z2_entertainment_events.json"
     
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(events, f, indent=2, ensure_ascii=False)
+        Path(output_file).write_bytes(orjson.dumps(events, option=orjson.OPT_INDENT_2))
         
         print(f"\n✓ Saved {len(events)} events to {output_file}")
         
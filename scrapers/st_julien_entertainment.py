@@ -5,46 +5,58 @@ URL: https://stjulien.com/boulder-colorado-events/month/?tribe_eventcategory%5B0
 This scraper extracts entertainment events from St Julien's JSON-LD structured data.
 """
 
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-import json
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+import orjson
 import re
 from datetime import datetime, date
+from pathlib import Path
 import pytz
+import requests
+
+from _browser import open_profile_page, block_resources
+from _page_cache import cached_page
+
+
+EVENTS_URL = 'https://stjulien.com/boulder-colorado-events/month/?tribe_eventcategory%5B0%5D=83'
+
+# Browser-like headers for the direct fetch
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+# Shared by every event (serialized as JSON arrays)
+EVENT_TYPE_TAGS = ('Entertainment', 'Hotel Events')
+VENUE_TYPE_TAGS = ('Hotel', 'Upscale')
+
+MONTH_NAMES = (None, 'January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December')
+
+# Body of each <script type="application/ld+json"> block
+JSON_LD_RE = re.compile(r'<script[^>]*application/ld\+json[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+
+# Field patterns for pulling event data out of malformed JSON-LD
+NAME_RE = re.compile(r'"name"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+START_DATE_RE = re.compile(r'"startDate"\s*:\s*"([^"]+)"')
+END_DATE_RE = re.compile(r'"endDate"\s*:\s*"([^"]+)"')
+URL_RE = re.compile(r'"url"\s*:\s*"([^"]+)"')
+
+# Backslash-escaped quotes left in titles/descriptions (\' and \")
+UNESCAPE_QUOTES_RE = re.compile(r'\\([\'"])')
 
 
 def scrape_st_julien_events():
-    """Scrape St Julien events using Playwright"""
+    """Scrape St Julien events, fetching the page directly and only rendering it if needed"""
     
     events = []
     
     try:
-        with sync_playwright() as p:
-            print("Launching browser...")
-            browser = p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox']
-            )
-            page = browser.new_page()
-            page.set_default_timeout(30000)
-            
-            print("Loading St Julien events page...")
-            page.goto('https://stjulien.com/boulder-colorado-events/month/?tribe_eventcategory%5B0%5D=83', 
-                     wait_until='domcontentloaded', timeout=30000)  # Changed from networkidle
-            page.wait_for_timeout(5000)  # Wait 5 seconds for content to render
-            
-            # Scroll to load all events
-            print("Scrolling to load all events...")
-            for i in range(5):
-                page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                page.wait_for_timeout(1500)
-            
-            print("Parsing events...")
-            html = page.content()
-            events = parse_st_julien_html(html)
-            
-            browser.close()
-            
+        html = cached_page(EVENTS_URL, load_st_julien_html)
+        
+        print("Parsing events...")
+        events = parse_st_julien_html(html)
+        
     except Exception as e:
         print(f"Error: {e}")
         import traceback
@@ -53,32 +65,86 @@ def scrape_st_julien_events():
     return events
 
 
+def load_st_julien_html():
+    """Get the events page HTML, only rendering it in a browser if needed"""
+    
+    html = fetch_st_julien_html()
+    
+    # The events are JSON-LD in the served HTML, so a browser is only a fallback
+    if not html or 'application/ld+json' not in html:
+        print("No event data in the fetched page, falling back to the browser...")
+        html = render_st_julien_html()
+    
+    return html
+
+
+def fetch_st_julien_html():
+    """Fetch the events page over plain HTTP (returns None on failure)"""
+    
+    print("Fetching St Julien events page...")
+    try:
+        response = requests.get(EVENTS_URL, headers=HEADERS, timeout=15)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Direct fetch failed: {e}")
+        return None
+    
+    return response.text
+
+
+def render_st_julien_html():
+    """Load the events page in Playwright and return the rendered HTML"""
+    
+    page = open_profile_page('st_julien')
+    page.set_default_timeout(30000)
+    
+    block_resources(page)
+    
+    print("Loading St Julien events page...")
+    page.goto(EVENTS_URL, wait_until='domcontentloaded', timeout=30000)  # Changed from networkidle
+    
+    # Wait for the event JSON-LD instead of a fixed delay
+    try:
+        page.wait_for_selector('script[type="application/ld+json"]',
+                               state='attached', timeout=15000)
+    except PlaywrightTimeoutError:
+        print("Timed out waiting for event data, parsing what loaded")
+    
+    html = page.content()
+    
+    page.close()
+    
+    return html
+
+
 def parse_st_julien_html(html):
     """Parse the HTML to extract JSON-LD event data"""
     
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    # Find all script tags with type="application/ld+json"
-    json_ld_scripts = soup.find_all('script', type='application/ld+json')
+    # Pull the raw JSON-LD script bodies out of the page (no parse tree needed)
+    json_ld_scripts = JSON_LD_RE.findall(html)
     print(f"Found {len(json_ld_scripts)} JSON-LD script tags")
     
     events = []
+    lines = []
+    seen = set()  # (title, date_ord, time_start) of events already kept
     mountain_tz = pytz.timezone('America/Denver')
-    today = datetime.now(mountain_tz).date()
+    # Compare dates as day ordinals (plain ints)
+    today_ord = datetime.now(mountain_tz).toordinal()
     
-    for script in json_ld_scripts:
+    for json_string in json_ld_scripts:
         try:
-            # Get the script content
-            json_string = script.string
-            
             if not json_string or not json_string.strip():
                 continue
             
             # Remove any leading/trailing whitespace
             json_string = json_string.strip()
             
+            # Skip WebSite/Organization/Breadcrumb blocks without parsing them
+            if '"Event"' not in json_string:
+                continue
+            
             # Parse the JSON content
-            json_data = json.loads(json_string)
+            json_data = orjson.loads(json_string)
             
             # Handle both single events and arrays of events
             events_to_process = []
@@ -99,80 +165,98 @@ def parse_st_julien_html(html):
                 event = parse_event_json(json_event)
                 
                 if event and event.get('title'):
-                    print(f"\n  Found: {event['title']}")
-                    print(f"    Date: {event.get('date')}")
-                    print(f"    Date obj: {event.get('date_obj')}")
-                    print(f"    Today: {today}")
-                    
                     # Filter: Only include today and future events
-                    if event.get('date_obj'):
-                        if event['date_obj'] >= today:
-                            print(f"    ✓ KEEPING (future event)")
+                    if event.get('date_ord'):
+                        if event['date_ord'] >= today_ord:
+                            # The same event can appear in more than one JSON-LD block
+                            key = (event['title'], event['date_ord'], event.get('time_start'))
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            
+                            lines.append(f"  ✓ {event['title']} - {event.get('date')}")
                             # Add venue info
                             event['venue'] = 'St Julien Hotel & Spa'
                             event['location'] = 'Boulder'
                             event['category'] = 'Entertainment'
                             event['source_url'] = 'https://stjulien.com/boulder-colorado-events/month/?tribe_eventcategory%5B0%5D=83'
-                            event['event_type_tags'] = ['Entertainment', 'Hotel Events']
-                            event['venue_type_tags'] = ['Hotel', 'Upscale']
+                            event['event_type_tags'] = EVENT_TYPE_TAGS
+                            event['venue_type_tags'] = VENUE_TYPE_TAGS
                             event['image'] = 'stjulien.jpg'
                             
-                            del event['date_obj']  # Remove before adding to list
+                            del event['date_ord']  # Remove before adding to list
                             events.append(event)
                         else:
-                            print(f"    ✗ SKIPPED (past event)")
+                            lines.append(f"  ✗ Skipped past event: {event['title']} - {event.get('date')}")
                     else:
-                        print(f"    ✗ SKIPPED (no date_obj)")
+                        lines.append(f"  ✗ Skipped (no date): {event['title']}")
             
-        except json.JSONDecodeError as e:
-            print(f"  ⚠️  JSON parse error: {str(e)[:100]}")
+        except orjson.JSONDecodeError as e:
+            lines.append(f"  ⚠️  JSON parse error: {str(e)[:100]}")
             continue
         except Exception as e:
-            print(f"  Error processing event: {e}")
+            lines.append(f"  Error processing event: {e}")
             continue
     
+    # One write for the whole page instead of several prints per event
+    if lines:
+        print("\n".join(lines))
+    
     print(f"\nFiltered to {len(events)} current/future events")
     
     return events
 
 
+def format_date(dt):
+    """Format a datetime like "December 06, 2025" (same output as strftime('%B %d, %Y'))"""
+    return f"{MONTH_NAMES[dt.month]} {dt.day:02d}, {dt.year}"
+
+
+def format_time(dt):
+    """Format a datetime's time like 6:00 PM (no leading zero on the hour)"""
+    return f"{(dt.hour - 1) % 12 + 1}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+
+
 def extract_event_from_broken_json(json_string):
     """
     Try to extract event data from malformed JSON using regex
     This is a fallback when JSON parsing fails
     """
-    import re
     
     event = {}
     
+    # Nothing to extract from blocks that aren't events
+    if '"Event"' not in json_string:
+        return None
+    
     # Extract name
-    name_match = re.search(r'"name"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"', json_string)
+    name_match = NAME_RE.search(json_string)
     if name_match:
-        title = name_match.group(1).replace("\\'", "'").replace('\\"', '"')
+        title = UNESCAPE_QUOTES_RE.sub(r'\1', name_match.group(1))
         event['title'] = title
     
     # Extract startDate
-    start_match = re.search(r'"startDate"\s*:\s*"([^"]+)"', json_string)
+    start_match = START_DATE_RE.search(json_string)
     if start_match:
         try:
             start_dt = datetime.fromisoformat(start_match.group(1))
-            event['date'] = start_dt.strftime('%B %d, %Y')
-            event['time_start'] = start_dt.strftime('%I:%M %p').lstrip('0').replace(' 0', ' ')
-            event['date_obj'] = start_dt.date()
+            event['date'] = format_date(start_dt)
+            event['time_start'] = format_time(start_dt)
+            event['date_ord'] = start_dt.toordinal()
         except:
             pass
     
     # Extract endDate
-    end_match = re.search(r'"endDate"\s*:\s*"([^"]+)"', json_string)
+    end_match = END_DATE_RE.search(json_string)
     if end_match:
         try:
             end_dt = datetime.fromisoformat(end_match.group(1))
-            event['time_end'] = end_dt.strftime('%I:%M %p').lstrip('0').replace(' 0', ' ')
+            event['time_end'] = format_time(end_dt)
         except:
             pass
     
     # Extract url
-    url_match = re.search(r'"url"\s*:\s*"([^"]+)"', json_string)
+    url_match = URL_RE.search(json_string)
     if url_match:
         event['link'] = url_match.group(1)
     
@@ -206,12 +290,12 @@ def parse_event_json(json_data):
     # Title
     if json_data.get('name'):
         # Unescape any escaped characters (like \')
-        title = json_data['name'].replace("\\'", "'").replace('\\"', '"')
+        title = UNESCAPE_QUOTES_RE.sub(r'\1', json_data['name'])
         event['title'] = title
     
     # Description
     if json_data.get('description'):
-        desc = json_data['description'].replace("\\'", "'").replace('\\"', '"')
+        desc = UNESCAPE_QUOTES_RE.sub(r'\1', json_data['description'])
         if desc and desc.strip():
             event['description'] = desc
     
@@ -227,14 +311,14 @@ def parse_event_json(json_data):
             start_dt = datetime.fromisoformat(start_datetime_str)
             
             # Format date: "December 6, 2025"
-            event['date'] = start_dt.strftime('%B %d, %Y')
+            event['date'] = format_date(start_dt)
             
             # Format start time: "6:00 PM"
-            start_time = start_dt.strftime('%I:%M %p').lstrip('0').replace(' 0', ' ')
+            start_time = format_time(start_dt)
             event['time_start'] = start_time
             
-            # Store date object for filtering
-            event['date_obj'] = start_dt.date()
+            # Store the day ordinal for filtering
+            event['date_ord'] = start_dt.toordinal()
             
         except Exception as e:
             print(f"    Error parsing start date: {e}")
@@ -247,7 +331,7 @@ def parse_event_json(json_data):
             end_dt = datetime.fromisoformat(end_datetime_str)
             
             # Format end time: "9:00 PM"
-            end_time = end_dt.strftime('%I:%M %p').lstrip('0').replace(' 0', ' ')
+            end_time = format_time(end_dt)
             event['time_end'] = end_time
             
         except Exception as e:
@@ -282,8 +366,7 @@ if __name__ == "__main__":
     
     # Save to JSON
     output_file = 'st_julien_events.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(events, f, indent=2, ensure_ascii=False)
+    Path(output_file).write_bytes(orjson.dumps(events, option=orjson.OPT_INDENT_2))
     
     print(f"✅ Saved to {output_file}\n")
     
@@ -5,13 +5,64 @@ URL: https://www.tridentcafe.com/events
 Scrapes events from Trident Cafe's events page with proper date parsing and filtering.
 """
 
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-import json
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from bs4 import BeautifulSoup, NavigableString
+import soupsieve as sv
+import orjson
 from datetime import datetime, date
+from pathlib import Path
 import pytz
 import re
 
+from _browser import open_profile_page, block_resources, scroll_until_stable
+from _page_cache import cached_page
+
+
+EVENTS_URL = 'https://www.tridentcafe.com/events'
+
+MOUNTAIN_TZ = pytz.timezone('America/Denver')
+
+# Shared by every event (serialized as JSON arrays)
+EVENT_TYPE_TAGS = ('Live Music', 'Books', 'Community')
+VENUE_TYPE_TAGS = ('Cafe', 'Bookstore', 'Music Venue')
+
+# Month abbreviation -> full name for Squarespace's short dates
+MONTH_MAP = {
+    'Jan': 'January', 'Feb': 'February', 'Mar': 'March',
+    'Apr': 'April', 'May': 'May', 'Jun': 'June',
+    'Jul': 'July', 'Aug': 'August', 'Sep': 'September',
+    'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
+}
+
+# Field selectors inside an event element; [class*=... i] keeps the old
+# case-insensitive substring match on class names
+TITLE_SELECTOR = sv.compile('[class*="eventlist-title" i], [class*="summary-title" i]')
+DATE_SELECTOR = sv.compile('[class*="eventlist-datetag" i], [class*="eventlist-meta-date" i], '
+                           '[class*="summary-metadata-item--date" i]')
+TIME_SELECTOR = sv.compile('[class*="eventlist-meta-time" i], [class*="event-time-localized" i]')
+DESC_SELECTOR = sv.compile('[class*="eventlist-description" i], [class*="summary-excerpt" i]')
+# Fallbacks when the Squarespace classes aren't there
+HEADING_SELECTOR = sv.compile('h1, h2, h3, h4')
+LINK_SELECTOR = sv.compile('a[href]')
+PARAGRAPH_SELECTOR = sv.compile('p')
+
+# Date/time text patterns, e.g. "Dec142:00 PM14:00"
+MONTH_DAY_RE = re.compile(r'([A-Z][a-z]{2,8})\s*(\d{1,2})', re.I)
+TIME_24_RE = re.compile(r'(\d{2}):(\d{2})$')
+TIME_AMPM_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM)', re.I)
+
+# Event container selectors, in priority order (the first one that matches wins)
+EVENT_SELECTORS = [
+    'li.eventlist-event',
+    'div.eventlist-event',
+    'article.eventlist-event',
+    '.sqs-block-summary-v2 .summary-item',
+    'div.summary-item',
+]
+EVENT_SELECTOR_PATTERNS = [sv.compile(selector) for selector in EVENT_SELECTORS]
+# All of the above in one selector, so the document is only walked once
+ANY_EVENT_SELECTOR = sv.compile(', '.join(EVENT_SELECTORS))
+
 
 def scrape_trident_events():
     """Scrape events from Trident Cafe using Playwright"""
@@ -19,32 +70,11 @@ def scrape_trident_events():
     events = []
     
     try:
-        with sync_playwright() as p:
-            print("Launching browser...")
-            browser = p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox']
-            )
-            page = browser.new_page()
-            page.set_default_timeout(30000)
-            
-            print("Loading Trident events page...")
-            page.goto('https://www.tridentcafe.com/events', 
-                     wait_until='domcontentloaded', timeout=30000)
-            page.wait_for_timeout(3000)
-            
-            # Scroll to load all content
-            print("Scrolling to load all events...")
-            for i in range(3):
-                page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                page.wait_for_timeout(1000)
-            
-            print("Parsing events...")
-            html = page.content()
-            events = parse_trident_html(html)
-            
-            browser.close()
-            
+        html = cached_page(EVENTS_URL, render_trident_html)
+        
+        print("Parsing events...")
+        events = parse_trident_html(html)
+        
     except Exception as e:
         print(f"Error: {e}")
         import traceback
@@ -53,23 +83,44 @@ def scrape_trident_events():
     return events
 
 
+def render_trident_html():
+    """Load the events page in Playwright and return the rendered HTML"""
+    
+    page = open_profile_page('trident')
+    page.set_default_timeout(30000)
+    block_resources(page)
+    
+    print("Loading Trident events page...")
+    page.goto(EVENTS_URL, wait_until='domcontentloaded', timeout=30000)
+    
+    # Wait for the first event instead of a fixed delay
+    try:
+        page.wait_for_selector(ANY_EVENT_SELECTOR.pattern, timeout=15000)
+    except PlaywrightTimeoutError:
+        print("Timed out waiting for events, parsing what loaded")
+    
+    # Scroll to load all content
+    print("Scrolling to load all events...")
+    scroll_until_stable(page, ANY_EVENT_SELECTOR.pattern, max_scrolls=3, pause_ms=1000)
+    
+    html = page.content()
+    
+    page.close()
+    
+    return html
+
+
 def parse_trident_html(html):
     """Parse the HTML to extract event data"""
     
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml')
     
     # Try multiple selectors for Squarespace event lists
-    event_selectors = [
-        'li.eventlist-event',
-        'div.eventlist-event',
-        'article.eventlist-event',
-        '.sqs-block-summary-v2 .summary-item',
-        'div.summary-item',
-    ]
+    candidates = ANY_EVENT_SELECTOR.select(soup)
     
     event_elements = []
-    for selector in event_selectors:
-        found = soup.select(selector)
+    for selector, pattern in zip(EVENT_SELECTORS, EVENT_SELECTOR_PATTERNS):
+        found = [element for element in candidates if pattern.match(element)]
         if found:
             print(f"Found {len(found)} events using selector: {selector}")
             event_elements = found
@@ -78,8 +129,10 @@ def parse_trident_html(html):
     print(f"Total event elements found: {len(event_elements)}")
     
     events = []
-    mountain_tz = pytz.timezone('America/Denver')
-    today = datetime.now(mountain_tz).date()
+    lines = []
+    seen = set()  # (title, date_ord, time) of events already kept
+    # Compare dates as day ordinals (plain ints)
+    today_ord = datetime.now(MOUNTAIN_TZ).toordinal()
     
     for element in event_elements:
         try:
@@ -92,25 +145,34 @@ def parse_trident_html(html):
                 event['category'] = 'Books & Literary'
                 event['source_url'] = 'https://www.tridentcafe.com/events'
                 event['image'] = 'trident.jpg'
-                event['event_type_tags'] = ['Live Music', 'Books', 'Community']
-                event['venue_type_tags'] = ['Cafe', 'Bookstore', 'Music Venue']
+                event['event_type_tags'] = EVENT_TYPE_TAGS
+                event['venue_type_tags'] = VENUE_TYPE_TAGS
                 
                 # Filter: Only include today and future events
-                if event.get('date_obj'):
-                    if event['date_obj'] >= today:
-                        del event['date_obj']  # Remove before adding to list
+                if event.get('date_ord'):
+                    if event['date_ord'] >= today_ord:
+                        key = (event['title'], event['date_ord'], event.get('time'))
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        
+                        del event['date_ord']  # Remove before adding to list
                         events.append(event)
-                        print(f"  ✓ {event['title']} - {event.get('date', 'N/A')}")
+                        lines.append(f"  ✓ {event['title']} - {event.get('date', 'N/A')}")
                     else:
-                        print(f"  ✗ Skipped past event: {event.get('title')} - {event.get('date')}")
+                        lines.append(f"  ✗ Skipped past event: {event.get('title')} - {event.get('date')}")
                 else:
                     # Skip events without parseable dates
-                    print(f"  ✗ Skipped (no date): {event.get('title', 'Unknown')}")
+                    lines.append(f"  ✗ Skipped (no date): {event.get('title', 'Unknown')}")
                     
         except Exception as e:
-            print(f"  Error parsing event: {e}")
+            lines.append(f"  Error parsing event: {e}")
             continue
     
+    # One write for the whole page instead of a print per event
+    if lines:
+        print("\n".join(lines))
+    
     print(f"\nFiltered to {len(events)} current/future events")
     
     return events
@@ -122,12 +184,10 @@ def parse_trident_event(element):
     event = {}
     
     # Title - look for h1 class="eventlist-title"
-    title_elem = element.find(class_=re.compile(r'eventlist-title|summary-title', re.I))
-    if not title_elem:
-        title_elem = element.find(['h1', 'h2', 'h3', 'h4'])
+    title_elem = TITLE_SELECTOR.select_one(element) or HEADING_SELECTOR.select_one(element)
     
     if title_elem:
-        title = title_elem.get_text(strip=True)
+        title = element_text(title_elem)
         # Validate title - skip if it's actually a description
         if title and len(title) < 200 and not title.startswith('http'):
             event['title'] = title
@@ -137,7 +197,7 @@ def parse_trident_event(element):
         return None
     
     # Link
-    link_elem = element.find('a', href=True)
+    link_elem = LINK_SELECTOR.select_one(element)
     if link_elem:
         link = link_elem.get('href', '')
         if link and not link.startswith('http'):
@@ -145,25 +205,23 @@ def parse_trident_event(element):
         event['link'] = link
     
     # Date/Time - look for eventlist-datetag or eventlist-meta-date
-    date_elem = element.find(class_=re.compile(r'eventlist-datetag|eventlist-meta-date|summary-metadata-item--date', re.I))
+    date_elem = DATE_SELECTOR.select_one(element)
     if date_elem:
-        date_text = date_elem.get_text(strip=True)
+        date_text = element_text(date_elem)
         parsed = parse_date_time(date_text)
         if parsed:
             event.update(parsed)
     
     # Time - separate time element
-    time_elem = element.find(class_=re.compile(r'eventlist-meta-time|event-time-localized', re.I))
+    time_elem = TIME_SELECTOR.select_one(element)
     if time_elem and not event.get('time'):
-        event['time'] = time_elem.get_text(strip=True)
+        event['time'] = element_text(time_elem)
     
     # Description
-    desc_elem = element.find(class_=re.compile(r'eventlist-description|summary-excerpt', re.I))
-    if not desc_elem:
-        desc_elem = element.find('p')
+    desc_elem = DESC_SELECTOR.select_one(element) or PARAGRAPH_SELECTOR.select_one(element)
     
     if desc_elem:
-        desc = desc_elem.get_text(strip=True)
+        desc = element_text(desc_elem)
         # Limit description length
         if len(desc) > 300:
             desc = desc[:300] + "..."
@@ -172,6 +230,16 @@ def parse_trident_event(element):
     return event
 
 
+def element_text(elem):
+    """Same as get_text(strip=True), but skips the descendant walk when the element holds a single string"""
+    
+    text = elem.string
+    # Only plain text; a lone comment/CDATA child comes back from .string too, but get_text skips it
+    if type(text) is NavigableString:
+        return text.strip()
+    return elem.get_text(strip=True)
+
+
 def parse_date_time(date_text):
     """
     Parse date/time from Squarespace format
@@ -190,26 +258,17 @@ def parse_date_time(date_text):
         
         # Try to extract date parts using regex
         # Pattern 1: "Dec142:00 PM14:00" or "Dec14"
-        match = re.search(r'([A-Z][a-z]{2,8})\s*(\d{1,2})', date_text, re.I)
+        match = MONTH_DAY_RE.search(date_text)
         if match:
             month_str = match.group(1)
             day_str = match.group(2)
             
             # Map month abbreviations
-            month_map = {
-                'Jan': 'January', 'Feb': 'February', 'Mar': 'March',
-                'Apr': 'April', 'May': 'May', 'Jun': 'June',
-                'Jul': 'July', 'Aug': 'August', 'Sep': 'September',
-                'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
-            }
-            
-            month_full = month_map.get(month_str[:3], month_str)
+            month_full = MONTH_MAP.get(month_str[:3], month_str)
             
             # Get current year and determine if we need next year
-            mountain_tz = pytz.timezone('America/Denver')
-            current_year = datetime.now(mountain_tz).year
-            mountain_tz = pytz.timezone('America/Denver')
-            current_date = datetime.now(mountain_tz).date()
+            current_date = datetime.now(MOUNTAIN_TZ).date()
+            current_year = current_date.year
             
             date_str = f"{month_full} {day_str}, {current_year}"
             parsed_date = datetime.strptime(date_str, '%B %d, %Y').date()
@@ -220,12 +279,12 @@ def parse_date_time(date_text):
                 parsed_date = datetime.strptime(date_str, '%B %d, %Y').date()
             
             result['date'] = date_str
-            result['date_obj'] = parsed_date
+            result['date_ord'] = parsed_date.toordinal()
         
         # Try to extract time
         # Strategy: Trident includes both 12-hour and 24-hour times like "2:00 PM14:00"
         # Use the 24-hour time at the end for accuracy
-        time_match_24 = re.search(r'(\d{2}):(\d{2})$', date_text.strip())
+        time_match_24 = TIME_24_RE.search(date_text.strip())
         if time_match_24:
             hour_int = int(time_match_24.group(1))
             minute = time_match_24.group(2)
@@ -241,7 +300,7 @@ def parse_date_time(date_text):
                 result['time'] = f"{hour_int - 12}:{minute} PM"
         else:
             # Fall back to AM/PM time search
-            time_match = re.search(r'(\d{1,2}):(\d{2})\s*(AM|PM)', date_text, re.I)
+            time_match = TIME_AMPM_RE.search(date_text)
             if time_match:
                 hour = time_match.group(1)
                 minute = time_match.group(2)
@@ -267,8 +326,7 @@ if __name__ == "__main__":
     
     # Save to JSON
     output_file = 'trident_events.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(events, f, indent=2, ensure_ascii=False)
+    Path(output_file).write_bytes(orjson.dumps(events, option=orjson.OPT_INDENT_2))
     
     print(f"✅ Saved to {output_file}\n")
     
@@ -5,13 +5,43 @@ URL: https://www.velvetelklounge.com/events/
 This scraper extracts music events from Velvet Elk Lounge's events page.
 """
 
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-import json
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+import lxml.html
+from lxml import etree
+import orjson
 import re
 from datetime import datetime, date
+from pathlib import Path
 import pytz
 
+from _browser import open_profile_page, block_resources
+
+
+# Event card links that carry "Month Day, Title" in their aria-label
+CARD_LINK_XPATH = etree.XPath(
+    "//a[contains(concat(' ', normalize-space(@class), ' '), ' card__btn ')][@aria-label]"
+)
+# Background-image div inside a card
+CARD_IMAGE_XPATH = etree.XPath(
+    ".//div[contains(concat(' ', normalize-space(@class), ' '), ' card__image ')]"
+)
+
+MOUNTAIN_TZ = pytz.timezone('America/Denver')
+
+# Shared by every event (serialized as JSON arrays)
+EVENT_TYPE_TAGS = ('Live Music', 'Nightlife')
+VENUE_TYPE_TAGS = ('Bar', 'Music Venue', 'Nightlife')
+
+# Full month name (lowercase) -> month number
+MONTH_NUMBERS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+# "Month Day(optional suffix), Title" in a card's aria-label
+ARIA_LABEL_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?,\s*(.+)', re.IGNORECASE)
+
 
 def scrape_velvet_elk_events():
     """Scrape events from Velvet Elk Lounge using Playwright"""
@@ -19,26 +49,26 @@ def scrape_velvet_elk_events():
     events = []
     
     try:
-        with sync_playwright() as p:
-            print("Launching browser...")
-            browser = p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox']
-            )
-            page = browser.new_page()
-            page.set_default_timeout(30000)
-            
-            print("Loading Velvet Elk events page...")
-            page.goto('https://www.velvetelklounge.com/events/', 
-                     wait_until='networkidle', timeout=30000)
-            page.wait_for_timeout(3000)
-            
-            print("Parsing events...")
-            html = page.content()
-            events = parse_velvet_elk_html(html)
-            
-            browser.close()
-            
+        page = open_profile_page('velvet_elk')
+        page.set_default_timeout(30000)
+        block_resources(page)
+        
+        print("Loading Velvet Elk events page...")
+        page.goto('https://www.velvetelklounge.com/events/', 
+                 wait_until='domcontentloaded', timeout=30000)
+        
+        # Wait for the event cards instead of network idle plus a fixed delay
+        try:
+            page.wait_for_selector('a.card__btn[aria-label]', state='attached', timeout=10000)
+        except PlaywrightTimeoutError:
+            print("Timed out waiting for event cards, parsing what loaded")
+        
+        print("Parsing events...")
+        html = page.content()
+        events = parse_velvet_elk_html(html)
+        
+        page.close()
+        
     except Exception as e:
         print(f"Error: {e}")
         import traceback
@@ -50,15 +80,14 @@ def scrape_velvet_elk_events():
 def parse_velvet_elk_html(html):
     """Parse the HTML to extract all events"""
     
-    soup = BeautifulSoup(html, 'html.parser')
+    tree = lxml.html.fromstring(html)
     
     # Find all event cards with aria-label
-    event_links = soup.find_all('a', class_='card__btn', attrs={'aria-label': True})
+    event_links = CARD_LINK_XPATH(tree)
     print(f"Found {len(event_links)} event cards")
     
     events = []
-    mountain_tz = pytz.timezone('America/Denver')
-    today = datetime.now(mountain_tz).date()
+    today = datetime.now(MOUNTAIN_TZ).date()
     
     for link in event_links:
         aria_label = link.get('aria-label', '')
@@ -69,59 +98,63 @@ def parse_velvet_elk_html(html):
         
         # Parse aria-label which has format: "Month Day, Event Title"
         # Example: "December 27, Rapidgrass"
-        event = parse_aria_label(aria_label, href)
-        
-        if event and event.get('title'):
-            # Get image from the card
-            img_div = link.find('div', class_='card__image')
-            if img_div:
-                style = img_div.get('style', '')
-                # Extract URL from background-image style
-                img_match = re.search(r"url\('([^']+)'\)", style)
-                if img_match:
-                    event['image'] = img_match.group(1)
-            
-            # Add venue info
-            event['venue'] = 'Velvet Elk Lounge'
-            event['location'] = 'Boulder'
-            event['category'] = 'Music'
-            event['source_url'] = 'https://www.velvetelklounge.com/events/'
-            event['event_type_tags'] = ['Live Music', 'Nightlife']
-            event['venue_type_tags'] = ['Bar', 'Music Venue', 'Nightlife']
-            
-            # Build full link
-            if href and not href.startswith('http'):
-                event['link'] = f"https://www.velvetelklounge.com{href}"
-            else:
-                event['link'] = href
-            
-            # Filter: Only include today and future events
-            if event.get('date_obj'):
-                if event['date_obj'] >= today:
-                    del event['date_obj']  # Remove before adding to list
-                    events.append(event)
-                    print(f"  ✓ {event['title']} - {event['date']}")
-                else:
-                    print(f"  ✗ Skipped past event: {event['title']}")
+        event = parse_aria_label(aria_label, href, today)
+        
+        if not event or not event.get('title') or not event.get('date_obj'):
+            continue
+        
+        # Filter first: only include today and future events
+        if event['date_obj'] < today:
+            print(f"  ✗ Skipped past event: {event['title']}")
+            continue
+        del event['date_obj']  # Remove before adding to list
+        
+        # Get image from the card
+        img_divs = CARD_IMAGE_XPATH(link)
+        if img_divs:
+            style = img_divs[0].get('style', '')
+            # Extract URL from background-image: url('...')
+            _, _, tail = style.partition("url('")
+            img_url, closed, _ = tail.partition("')")
+            if closed and img_url:
+                event['image'] = img_url
+        
+        # Add venue info
+        event['venue'] = 'Velvet Elk Lounge'
+        event['location'] = 'Boulder'
+        event['category'] = 'Music'
+        event['source_url'] = 'https://www.velvetelklounge.com/events/'
+        event['event_type_tags'] = EVENT_TYPE_TAGS
+        event['venue_type_tags'] = VENUE_TYPE_TAGS
+        
+        # Build full link
+        if href and not href.startswith('http'):
+            event['link'] = f"https://www.velvetelklounge.com{href}"
+        else:
+            event['link'] = href
+        
+        events.append(event)
+        print(f"  ✓ {event['title']} - {event['date']}")
     
     print(f"\nFiltered to {len(events)} current/future events")
     
     return events
 
 
-def parse_aria_label(aria_label, href=''):
+def parse_aria_label(aria_label, href='', today=None):
     """
     Parse aria-label to extract date and title
     Format: "Month Day, Event Title" or "Month Day(th/st/nd/rd), Event Title"
     Examples: 
     - "December 27, Rapidgrass"
     - "December 18, LatkePalooza II: A Chanukah Celebration!"
+    today is the current Mountain date (looked up if not given)
     """
     
     event = {}
     
     # Pattern: "Month Day(optional suffix), Title"
-    match = re.match(r'([A-Za-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?,\s*(.+)', aria_label, re.IGNORECASE)
+    match = ARIA_LABEL_RE.match(aria_label)
     
     if match:
         month = match.group(1)
@@ -132,23 +165,25 @@ def parse_aria_label(aria_label, href=''):
         event['date'] = f"{month} {day}"
         
         # Try to create a full date for filtering
-        try:
-            # Add current year
-            mountain_tz = pytz.timezone('America/Denver')
-            current_year = datetime.now(mountain_tz).year
-            date_str = f"{month} {day}, {current_year}"
-            parsed_date = datetime.strptime(date_str, '%B %d, %Y').date()
-            
-            # If the date is in the past, try next year
-            if parsed_date < datetime.now(mountain_tz).date():
-                date_str = f"{month} {day}, {current_year + 1}"
-                parsed_date = datetime.strptime(date_str, '%B %d, %Y').date()
-            
-            event['date'] = date_str
-            event['date_obj'] = parsed_date
-        except:
-            # If parsing fails, just use what we have
-            pass
+        month_num = MONTH_NUMBERS.get(month.lower())
+        if month_num:
+            try:
+                # Add current year
+                if today is None:
+                    today = datetime.now(MOUNTAIN_TZ).date()
+                current_year = today.year
+                parsed_date = date(current_year, month_num, int(day))
+                
+                # If the date is in the past, try next year
+                if parsed_date < today:
+                    current_year += 1
+                    parsed_date = date(current_year, month_num, int(day))
+                
+                event['date'] = f"{month} {day}, {current_year}"
+                event['date_obj'] = parsed_date
+            except ValueError:
+                # Not a real day (e.g. February 30), just use what we have
+                pass
     
     return event
 
@@ -166,8 +201,7 @@ if __name__ == "__main__":
     
     # Save to JSON
     output_file = 'velvet_elk_events.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(events, f, indent=2, ensure_ascii=False)
+    Path(output_file).write_bytes(orjson.dumps(events, option=orjson.OPT_INDENT_2))
     
     print(f"✅ Saved to {output_file}\n")
     